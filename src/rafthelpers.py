@@ -1,68 +1,100 @@
 """
 Encoding and decoding with Bencode.
 """
-import builtins
+import itertools
 import re
 
 
-def encode_item(element):
-    if element is None:
-        return ""
+INTEGER_PATTERN = re.compile(r"i(-?\d+)e")
+LENGTH_PATTERN = re.compile(r"(\d+):")
 
-    match type(element):
-        case builtins.int:
-            return f"i{str(element)}e"
 
-        case builtins.str:
-            return f"{len(element)}:{element}"
+def write_integer(element, collection):
+    collection.append(f"i{str(element)}e")
 
-        case builtins.list:
-            return "l" + "".join([encode_item(item) for item in element]) + "e"
 
-        case builtins.dict:
-            collection = []
+def write_string(element, collection):
+    collection.append(f"{len(element)}:{element}")
 
-            for pair in sorted(element.items()):
-                for item in pair:
-                    collection.append(item)
 
-            return "d" + "".join([encode_item(item) for item in collection]) + "e"
+def write_list(element, collection):
+    collection.append("l")
 
-        case _:
-            raise Exception(f"Exhaustive switch error in encoding item {element}.")
+    for item in element:
+        write_item(item, collection)
 
+    collection.append("e")
 
-def decode_item(string):
-    def closure(string):
-        if string == "":
-            return None, ""
 
-        elif string.startswith("i"):
-            match = re.match("i(-?\\d+)e", string)
-            return int(match.group(1)), string[match.span()[1] :]
+def write_dict(element, collection):
+    collection.append("d")
+
+    for item in itertools.chain.from_iterable(sorted(element.items())):
+        write_item(item, collection)
+
+    collection.append("e")
+
+
+WRITER_BY_TYPE = {
+    int: write_integer,
+    str: write_string,
+    list: write_list,
+    dict: write_dict,
+}
+
+
+def write_item(element, collection):
+    if element is None:
+        return
 
-        elif string[0] in "0123456789":
-            match = re.match("(\\d+):", string)
-            start = match.span()[1]
+    writer = WRITER_BY_TYPE.get(type(element))
+
+    if writer is None:
+        raise Exception(f"Exhaustive switch error in encoding item {element}.")
+
+    writer(element, collection)
+
+
+def encode_item(element):
+    collection = []
+    write_item(element, collection)
+
+    return "".join(collection)
+
+
+def decode_item(string):
+    # Track progress with an index cursor rather than slicing off the consumed
+    # prefix, so no intermediate substrings are allocated.
+    def closure(string, cursor):
+        if cursor == len(string):
+            return None, cursor
+
+        elif string[cursor] == "i":
+            match = INTEGER_PATTERN.match(string, cursor)
+            return int(match.group(1)), match.end()
+
+        elif string[cursor].isdigit():
+            match = LENGTH_PATTERN.match(string, cursor)
+            start = match.end()
             end = start + int(match.group(1))
-            return string[start:end], string[end:]
+            return string[start:end], end
 
-        elif string[0] in {"l", "d"}:
+        elif string[cursor] in {"l", "d"}:
             elements = []
-            rest = string[1:]
+            rest = cursor + 1
 
-            while not rest.startswith("e"):
-                element, rest = closure(rest)
+            while string[rest] != "e":
+                element, rest = closure(string, rest)
                 elements.append(element)
 
-            rest = rest[1:]
+            rest += 1
 
-            if string.startswith("l"):
+            if string[cursor] == "l":
                 return elements, rest
 
             return {k: v for k, v in zip(elements[::2], elements[1::2])}, rest
 
         else:
-            raise Exception(f"Malformed string {string}.")
+            raise Exception(f"Malformed string {string[cursor:]}.")
 
-    return closure(string)[0]
+    return closure(string, 0)[0]
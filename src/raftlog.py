@@ -24,24 +24,11 @@ from typing import List
 import dataclasses
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class LogEntry:
     term: int
     item: str
 
-    def __equals__(self, other) -> bool:
-        return self.term == other.term and self.item == other.item
-
-    def __repr__(self) -> str:
-        return f"LogEntry({str(self.term)}, '{self.item}')"
-
-
-def is_equal_entry(log: List[LogEntry], previous_index: int, entry: LogEntry) -> bool:
-    if previous_index < len(log) - 1 and log[previous_index + 1] != entry:
-        return False
-
-    return True
-
 
 def append_entries(
     log: List[LogEntry],
@@ -57,18 +44,52 @@ def append_entries(
     if previous_index >= 0 and log[previous_index].term != previous_term:
         return False
 
-    # If term number of existing entry is less than term of entry to be
-    # replaced, remove that entry and following entries. Conflict resolved by
-    # using the later term as truth since there can only be one leader.
+    # Heartbeats carry no entries, so once the continuity checks above pass
+    # there is nothing to reconcile.
+    if not entries:
+        return True
+
+    # Single pass over entries. If term number of existing entry is less than
+    # term of entry to be replaced, remove that entry and following entries.
+    # Conflict resolved by using the later term as truth since there can only
+    # be one leader. Entries past the end of the log are appended directly.
     for n, entry in enumerate(entries, start=previous_index + 1):
-        if n < len(log) and log[n].term != entry.term:
-            del log[n:]
-            break
+        if n < len(log):
+            if log[n].term != entry.term:
+                del log[n:]
+                log.append(entry)
 
-    for i, entry in enumerate(entries):
-        if not is_equal_entry(log, previous_index + i, entry):
-            return False
+            elif log[n] != entry:
+                return False
 
-    log += entries[len(log) - previous_index - 1 :]
+        else:
+            log.append(entry)
 
     return True
+
+
+def conflict_hint(log: List[LogEntry], previous_index: int, previous_term: int) -> int:
+    """
+    First index the leader should retry from after a failed append_entries.
+
+    - If the log has a gap at previous_index, the leader needs to resend from
+      the end of the log.
+    - If the term number at previous_index conflicts, every entry of that term
+      comes from the same (stale) leader, so walk back to the first entry of
+      the conflicting term.
+    """
+    log_length = len(log)
+
+    if previous_index >= log_length:
+        return log_length
+
+    if previous_index >= 0 and log[previous_index].term != previous_term:
+        conflict_term = log[previous_index].term
+        index = previous_index
+
+        while index > 0 and log[index - 1].term == conflict_term:
+            index -= 1
+
+        return index
+
+    return previous_index
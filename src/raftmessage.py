@@ -37,7 +37,7 @@ term            currentTerm, for candidate to update itself
 voteGranted     true means candidate received vote
 """
 
-from typing import List
+from typing import List, Optional
 import dataclasses
 import enum
 
@@ -58,28 +58,28 @@ class MessageType(enum.Enum):
     TEXT = "TEXT"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Message:
     source: int
     target: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Text(Message):
     text: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ClientLogAppend(Message):
     item: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateFollowers(Message):
     followers: List[int]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AppendEntryRequest(Message):
     current_term: int
     previous_index: int
@@ -88,131 +88,238 @@ class AppendEntryRequest(Message):
     commit_index: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AppendEntryResponse(Message):
     current_term: int
     success: bool
     entries_length: int
+    hint: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RunElection(Message):
     followers: List[int]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RequestVoteRequest(Message):
     current_term: int
     last_log_index: int
     last_log_term: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RequestVoteResponse(Message):
     success: bool
     current_term: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RoleChange(Message):
     from_role: raftrole.Role
     to_role: raftrole.Role
 
 
-def encode_message(message: Message) -> str:
-    attributes = vars(message).copy()
+def text_attributes(message: Text) -> dict:
+    return {
+        "message_type": MessageType.TEXT.value,
+        "source": message.source,
+        "target": message.target,
+        "text": message.text,
+    }
+
+
+def client_log_append_attributes(message: ClientLogAppend) -> dict:
+    return {
+        "message_type": MessageType.CLIENT_LOG_APPEND.value,
+        "source": message.source,
+        "target": message.target,
+        "item": message.item,
+    }
+
+
+def update_followers_attributes(message: UpdateFollowers) -> dict:
+    return {
+        "message_type": MessageType.UPDATE_FOLLOWERS.value,
+        "source": message.source,
+        "target": message.target,
+        "followers": message.followers,
+    }
+
+
+# Single-slot cache for broadcast heartbeats, where every follower's request
+# shares one entries list object. Holding a reference to the key list keeps
+# its identity stable for the lifetime of the cache entry.
+ENTRIES_CACHE_KEY: Optional[List[raftlog.LogEntry]] = None
+ENTRIES_CACHE_VALUE: List[dict] = []
+
+
+def entries_attributes(entries: List[raftlog.LogEntry]) -> List[dict]:
+    global ENTRIES_CACHE_KEY, ENTRIES_CACHE_VALUE
+
+    if entries is not ENTRIES_CACHE_KEY:
+        ENTRIES_CACHE_KEY = entries
+        ENTRIES_CACHE_VALUE = [
+            {"term": entry.term, "item": entry.item} for entry in entries
+        ]
+
+    return ENTRIES_CACHE_VALUE
+
+
+def append_entry_request_attributes(message: AppendEntryRequest) -> dict:
+    return {
+        "message_type": MessageType.APPEND_REQUEST.value,
+        "source": message.source,
+        "target": message.target,
+        "current_term": message.current_term,
+        "previous_index": message.previous_index,
+        "previous_term": message.previous_term,
+        "entries": entries_attributes(message.entries),
+        "commit_index": message.commit_index,
+    }
+
+
+def append_entry_response_attributes(message: AppendEntryResponse) -> dict:
+    return {
+        "message_type": MessageType.APPEND_RESPONSE.value,
+        "source": message.source,
+        "target": message.target,
+        "current_term": message.current_term,
+        "success": int(message.success),
+        "entries_length": message.entries_length,
+        "hint": message.hint,
+    }
+
+
+def run_election_attributes(message: RunElection) -> dict:
+    return {
+        "message_type": MessageType.RUN_ELECTION.value,
+        "source": message.source,
+        "target": message.target,
+        "followers": message.followers,
+    }
+
+
+def request_vote_request_attributes(message: RequestVoteRequest) -> dict:
+    return {
+        "message_type": MessageType.VOTE_REQUEST.value,
+        "source": message.source,
+        "target": message.target,
+        "current_term": message.current_term,
+        "last_log_index": message.last_log_index,
+        "last_log_term": message.last_log_term,
+    }
+
+
+def request_vote_response_attributes(message: RequestVoteResponse) -> dict:
+    return {
+        "message_type": MessageType.VOTE_RESPONSE.value,
+        "source": message.source,
+        "target": message.target,
+        "success": int(message.success),
+        "current_term": message.current_term,
+    }
+
+
+def role_change_attributes(message: RoleChange) -> dict:
+    return {
+        "message_type": MessageType.ROLE_CHANGE.value,
+        "source": message.source,
+        "target": message.target,
+        "from_role": message.from_role.value,
+        "to_role": message.to_role.value,
+    }
+
+
+ATTRIBUTES_BY_TYPE = {
+    Text: text_attributes,
+    ClientLogAppend: client_log_append_attributes,
+    UpdateFollowers: update_followers_attributes,
+    AppendEntryRequest: append_entry_request_attributes,
+    AppendEntryResponse: append_entry_response_attributes,
+    RunElection: run_election_attributes,
+    RequestVoteRequest: request_vote_request_attributes,
+    RequestVoteResponse: request_vote_response_attributes,
+    RoleChange: role_change_attributes,
+}
 
-    match message:
-        case ClientLogAppend():
-            attributes["message_type"] = MessageType.CLIENT_LOG_APPEND.value
 
-        case UpdateFollowers():
-            attributes["message_type"] = MessageType.UPDATE_FOLLOWERS.value
+def encode_message(message: Message) -> str:
+    attributes_builder = ATTRIBUTES_BY_TYPE.get(type(message))
 
-        case AppendEntryRequest():
-            entries = []
+    if attributes_builder is None:
+        raise Exception(
+            f"Exhaustive switch error in encoding message {message}."
+        )
 
-            for entry in message.entries:
-                entries.append(vars(entry))
+    return rafthelpers.encode_item(attributes_builder(message))
 
-            attributes["message_type"] = MessageType.APPEND_REQUEST.value
-            attributes["entries"] = entries
 
-        case AppendEntryResponse():
-            attributes["message_type"] = MessageType.APPEND_RESPONSE.value
-            attributes["success"] = int(attributes["success"])
+def decode_text(attributes: dict) -> Text:
+    return Text(**attributes)
 
-        case RunElection():
-            attributes["message_type"] = MessageType.RUN_ELECTION.value
 
-        case RequestVoteRequest():
-            attributes["message_type"] = MessageType.VOTE_REQUEST.value
+def decode_client_log_append(attributes: dict) -> ClientLogAppend:
+    return ClientLogAppend(**attributes)
 
-        case RequestVoteResponse():
-            attributes["message_type"] = MessageType.VOTE_RESPONSE.value
-            attributes["success"] = int(attributes["success"])
 
-        case RoleChange():
-            attributes["message_type"] = MessageType.ROLE_CHANGE.value
-            attributes["from_role"] = attributes["from_role"].value
-            attributes["to_role"] = attributes["to_role"].value
+def decode_update_followers(attributes: dict) -> UpdateFollowers:
+    return UpdateFollowers(**attributes)
 
-        case Text():
-            attributes["message_type"] = MessageType.TEXT.value
 
-        case _:
-            raise Exception(
-                f"Exhaustive switch error in encoding message with attributes {attributes}."
-            )
+def decode_append_entry_request(attributes: dict) -> AppendEntryRequest:
+    attributes["entries"] = [
+        raftlog.LogEntry(**entry) for entry in attributes["entries"]
+    ]
+    return AppendEntryRequest(**attributes)
 
-    return rafthelpers.encode_item(attributes)
 
+def decode_append_entry_response(attributes: dict) -> AppendEntryResponse:
+    attributes["success"] = bool(attributes["success"])
+    return AppendEntryResponse(**attributes)
 
-def decode_message(string: str) -> Message:
-    attributes = rafthelpers.decode_item(string)
 
-    message_type = MessageType(attributes["message_type"])
-    del attributes["message_type"]
+def decode_run_election(attributes: dict) -> RunElection:
+    return RunElection(**attributes)
 
-    match message_type:
-        case MessageType.CLIENT_LOG_APPEND:
-            return ClientLogAppend(**attributes)
 
-        case MessageType.UPDATE_FOLLOWERS:
-            return UpdateFollowers(**attributes)
+def decode_request_vote_request(attributes: dict) -> RequestVoteRequest:
+    return RequestVoteRequest(**attributes)
 
-        case MessageType.APPEND_REQUEST:
-            entries = []
 
-            for entry in attributes["entries"]:
-                entries.append(raftlog.LogEntry(**entry))
+def decode_request_vote_response(attributes: dict) -> RequestVoteResponse:
+    attributes["success"] = bool(attributes["success"])
+    return RequestVoteResponse(**attributes)
 
-            attributes["entries"] = entries
-            return AppendEntryRequest(**attributes)
 
-        case MessageType.APPEND_RESPONSE:
-            attributes["success"] = bool(attributes["success"])
-            return AppendEntryResponse(**attributes)
+def decode_role_change(attributes: dict) -> RoleChange:
+    attributes["from_role"] = raftrole.Role(attributes["from_role"])
+    attributes["to_role"] = raftrole.Role(attributes["to_role"])
+    return RoleChange(**attributes)
 
-        case MessageType.RUN_ELECTION:
-            return RunElection(**attributes)
 
-        case MessageType.VOTE_REQUEST:
-            return RequestVoteRequest(**attributes)
+DECODER_BY_MESSAGE_TYPE = {
+    MessageType.TEXT: decode_text,
+    MessageType.CLIENT_LOG_APPEND: decode_client_log_append,
+    MessageType.UPDATE_FOLLOWERS: decode_update_followers,
+    MessageType.APPEND_REQUEST: decode_append_entry_request,
+    MessageType.APPEND_RESPONSE: decode_append_entry_response,
+    MessageType.RUN_ELECTION: decode_run_election,
+    MessageType.VOTE_REQUEST: decode_request_vote_request,
+    MessageType.VOTE_RESPONSE: decode_request_vote_response,
+    MessageType.ROLE_CHANGE: decode_role_change,
+}
 
-        case MessageType.VOTE_RESPONSE:
-            attributes["success"] = bool(attributes["success"])
-            return RequestVoteResponse(**attributes)
 
-        case MessageType.ROLE_CHANGE:
-            attributes["from_role"] = raftrole.Role(attributes["from_role"])
-            attributes["to_role"] = raftrole.Role(attributes["to_role"])
-            return RoleChange(**attributes)
+def decode_message(string: str) -> Message:
+    attributes = rafthelpers.decode_item(string)
+
+    message_type = MessageType(attributes.pop("message_type"))
+    decoder = DECODER_BY_MESSAGE_TYPE.get(message_type)
 
-        case MessageType.TEXT:
-            return Text(**attributes)
+    if decoder is None:
+        raise Exception(
+            f"Exhaustive switch error in decoding message with attributes {attributes}."
+        )
 
-        case _:
-            raise Exception(
-                f"Exhaustive switch error in decoding message with attributes {attributes}."
-            )
+    return decoder(attributes)
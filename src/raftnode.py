@@ -48,7 +48,7 @@ class RaftNode:
 
     def __post_init__(self) -> None:
         self.socket: socket.socket = initialize_socket(self.identifier)
-        self.incoming: queue.Queue = queue.Queue()
+        self.incoming: queue.SimpleQueue = queue.SimpleQueue()
         self.outgoing: Dict[int, queue.Queue] = {
             i: queue.Queue() for i in raftconfig.ADDRESS_BY_IDENTIFIER
         }
@@ -82,16 +82,18 @@ class RaftNode:
             client, address = self.socket.accept()
             threading.Thread(target=self._listen, args=(client,)).start()
 
+    def _frame(self, message: bytes) -> bytes:
+        return len(message).to_bytes(4, byteorder="big") + message
+
     def _deliver(
-        self, sock: Optional[socket.socket], address: Tuple[str, int], message: bytes
+        self, sock: Optional[socket.socket], address: Tuple[str, int], payload: bytes
     ) -> Optional[socket.socket]:
         try:
             if sock is None:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.connect(address)
 
-            sock.sendall(len(message).to_bytes(4, byteorder="big"))
-            sock.sendall(message)
+            sock.sendall(payload)
 
         except Exception as e:
             print(e)
@@ -103,15 +105,24 @@ class RaftNode:
         """
         Run in background thread to deliver outgoing messages to other nodes.
         The delivery is best-efforts, in which the message is discarded if the
-        remote server is not operational.
+        remote server is not operational. Messages already queued for the same
+        target are coalesced into a single write.
         """
         sock = None
         address = raftconfig.ADDRESS_BY_IDENTIFIER[identifier]
 
         try:
             while True:
-                message = self.outgoing[identifier].get()
-                sock = self._deliver(sock, address, message)
+                payload = self._frame(self.outgoing[identifier].get())
+
+                try:
+                    while True:
+                        payload += self._frame(self.outgoing[identifier].get_nowait())
+
+                except queue.Empty:
+                    pass
+
+                sock = self._deliver(sock, address, payload)
 
         finally:
             # Defensive coding to avoid partial system failure.
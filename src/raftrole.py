@@ -25,6 +25,7 @@ Candidates (§5.2):
 """
 from typing import Optional, Tuple, TypedDict
 import enum
+import functools
 
 
 class Role(enum.Enum):
@@ -167,11 +168,14 @@ def evaluate_role_change(
     return role_change, current_term, voted_for
 
 
+@functools.lru_cache(maxsize=None)
 def evaluate_operations(
     role_change: Optional[Tuple[Role, Role]]
 ) -> Tuple[Operation, Operation, Operation, Operation, Operation]:
     """
-    Changes to attributes on the back of role changes.
+    Changes to attributes on the back of role changes. There is only a handful
+    of distinct role changes, so the resulting operation tuples are memoized
+    and the match runs once per shape for the life of the process.
 
     - For next_index and match_index, only need to be dictionaries when
       promoted to be leader. When change from leader to follower, reset back
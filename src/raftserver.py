@@ -8,7 +8,6 @@ import os
 import random
 import sys
 import threading
-import time
 
 import raftmessage
 import raftnode
@@ -18,6 +17,17 @@ import raftstate
 
 TIMEOUT = 3
 
+# Role and request type pairs that disable follower role change in the
+# current cycle, as a precomputed frozenset for O(1) membership checks on the
+# hot receive loop.
+RESET_DISABLE = frozenset(
+    {
+        (raftrole.Role.FOLLOWER, raftmessage.AppendEntryRequest),
+        (raftrole.Role.FOLLOWER, raftmessage.RequestVoteRequest),
+        (raftrole.Role.CANDIDATE, raftmessage.RequestVoteResponse),
+    }
+)
+
 
 @dataclasses.dataclass
 class RaftServer:
@@ -26,27 +36,35 @@ class RaftServer:
     def __post_init__(self) -> None:
         self.state: raftstate.RaftState = raftstate.RaftState(self.identifier)
         self.node: raftnode.RaftNode = raftnode.RaftNode(self.identifier)
-        self.timer: threading.Timer = threading.Timer(TIMEOUT, self.timeout)
+        self.timer_stop: threading.Event = threading.Event()
         self.reset: bool = True
 
     def send(self, messages: List[raftmessage.Message]) -> None:
         for message in messages:
             self.node.send(message.target, raftmessage.encode_message(message))
 
-    def cycle(self) -> None:
-        timeout = TIMEOUT if self.state.role == raftrole.Role.LEADER else 2 * TIMEOUT
+    def timer_interval(self) -> float:
+        if self.state.role == raftrole.Role.LEADER:
+            return TIMEOUT
 
-        self.timer.cancel()
-        self.timer = threading.Timer(timeout, self.timeout)
-        self.timer.start()
+        # Random jitter before starting elections, folded into the wait
+        # deadline so a leader heartbeat arriving during the jitter window can
+        # still disable the role change.
+        if self.state.role == raftrole.Role.FOLLOWER:
+            return 2 * TIMEOUT + random.random() * TIMEOUT
 
-        self.reset = True
+        return 2 * TIMEOUT
 
-    def timeout(self) -> None:
-        # Random timeout before starting elections.
-        if self.state.role == raftrole.Role.FOLLOWER:
-            time.sleep(random.random() * TIMEOUT)
+    def run_timer(self) -> None:
+        """
+        Run in background thread as a single long-lived timer. Waiting on the
+        event replaces creating a fresh Timer thread each cycle; the event is
+        only set on shutdown.
+        """
+        while not self.timer_stop.wait(self.timer_interval()):
+            self.timeout()
 
+    def timeout(self) -> None:
         # Allow state change only when reset flag is set to True. This will
         # happen at the end of each cycle unless a leader heartbeat or follower
         # vote request/response is received.
@@ -54,17 +72,24 @@ class RaftServer:
             message = raftstate.change_state_on_timeout(self.state)
             self.node.incoming.put(raftmessage.encode_message(message))
 
-        self.cycle()
+        self.reset = True
 
     def color(self) -> str:
         return raftrole.color(self.state.role)
 
     def respond(self) -> None:
+        # Bind the per-message lookups once outside the loop; the node, state
+        # and module references are stable for the life of the server.
+        receive = self.node.receive
+        decode_message = raftmessage.decode_message
+        handle_message = self.state.handle_message
+        send = self.send
+
         while True:
-            payload = self.node.receive()
+            payload = receive()
 
             try:
-                request = raftmessage.decode_message(payload)
+                request = decode_message(payload)
                 print(
                     self.color() + f"\n{request.source} > {request.target} {payload}",
                     end="",
@@ -73,25 +98,21 @@ class RaftServer:
                 # If receive leader heartbeat or vote request/response, set
                 # reset flag to False to disable follower role change in the
                 # current cycle.
-                if (self.state.role, type(request)) in [
-                    (raftrole.Role.FOLLOWER, raftmessage.AppendEntryRequest),
-                    (raftrole.Role.FOLLOWER, raftmessage.RequestVoteRequest),
-                    (raftrole.Role.CANDIDATE, raftmessage.RequestVoteResponse),
-                ]:
+                if (self.state.role, type(request)) in RESET_DISABLE:
                     self.reset = False
 
                 if not isinstance(request, raftmessage.Text):
                     print(self.color() + f"\n{request.target} > ", end="")
 
-                response = self.state.handle_message(request)
-                self.send(response)
+                response = handle_message(request)
+                send(response)
 
             except Exception as e:
                 print(self.color() + f"Exception: {e}")
 
     def run(self):
         self.node.start()
-        self.timer.start()
+        threading.Thread(target=self.run_timer, args=()).start()
         self.respond()
 
         print(self.color() + "end.")
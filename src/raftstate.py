@@ -58,8 +58,9 @@ Leaders:
 - If there exists an N such that N > commitIndex, a majority of matchIndex[i] ≥
   N, and log[N].term == currentTerm: set commitIndex = N (§5.3, §5.4).
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import dataclasses
+import heapq
 
 import raftconfig
 import raftlog
@@ -67,33 +68,168 @@ import raftmessage
 import raftrole
 
 
-@dataclasses.dataclass
+# Shared payload for heartbeats to followers that are fully caught up, so the
+# common idle case does not allocate a fresh empty slice per follower per
+# tick. Never mutated.
+EMPTY_ENTRIES: List[raftlog.LogEntry] = []
+
+
+def reset_next_index(state: "RaftState") -> None:
+    state.next_index = None
+
+
+def initialize_next_index(state: "RaftState") -> None:
+    state.next_index = {identifier: len(state.log) for identifier in state.config}
+
+
+def reset_match_index(state: "RaftState") -> None:
+    state.match_index = None
+    state.null_match_index_count = 0
+
+
+def initialize_match_index(state: "RaftState") -> None:
+    state.match_index = {identifier: None for identifier in state.config}
+    state.match_index[state.identifier] = len(state.log) - 1
+    state.null_match_index_count = len(state.config) - 1
+
+
+def reset_commit_index(state: "RaftState") -> None:
+    # Exception to RESET_TO_NONE, where reset is to -1. This is to simplify
+    # message passing since integers are handled in the encoding/decoding
+    # step, but None needs an extra step. Setting to -1 skip this step, but
+    # care is needed at call sites to make sure change is via assignment
+    # rather than addition.
+    state.commit_index = -1
+
+
+def initialize_commit_index(state: "RaftState") -> None:
+    raise Exception("Invalid initialization operation for commit index.")
+
+
+def reset_has_followers(state: "RaftState") -> None:
+    state.has_followers = None
+
+
+def initialize_has_followers(state: "RaftState") -> None:
+    state.has_followers = False
+
+
+def reset_voted_for(state: "RaftState") -> None:
+    state.voted_for = None
+
+
+def initialize_voted_for(state: "RaftState") -> None:
+    state.voted_for = state.identifier
+
+
+def reset_current_votes(state: "RaftState") -> None:
+    state.current_votes = None
+    state.self_vote_count = 0
+
+
+def initialize_current_votes(state: "RaftState") -> None:
+    state.current_votes = {identifier: None for identifier in state.config}
+    state.current_votes[state.identifier] = state.identifier
+    state.self_vote_count = 1
+
+
+OPERATIONS_BY_ATTRIBUTE: Dict[
+    str, Dict[raftrole.Operation, Callable[["RaftState"], None]]
+] = {
+    "next_index": {
+        raftrole.Operation.RESET_TO_NONE: reset_next_index,
+        raftrole.Operation.INITIALIZE: initialize_next_index,
+    },
+    "match_index": {
+        raftrole.Operation.RESET_TO_NONE: reset_match_index,
+        raftrole.Operation.INITIALIZE: initialize_match_index,
+    },
+    "commit_index": {
+        raftrole.Operation.RESET_TO_NONE: reset_commit_index,
+        raftrole.Operation.INITIALIZE: initialize_commit_index,
+    },
+    "has_followers": {
+        raftrole.Operation.RESET_TO_NONE: reset_has_followers,
+        raftrole.Operation.INITIALIZE: initialize_has_followers,
+    },
+    "voted_for": {
+        raftrole.Operation.RESET_TO_NONE: reset_voted_for,
+        raftrole.Operation.INITIALIZE: initialize_voted_for,
+    },
+    "current_votes": {
+        raftrole.Operation.RESET_TO_NONE: reset_current_votes,
+        raftrole.Operation.INITIALIZE: initialize_current_votes,
+    },
+}
+
+
+@dataclasses.dataclass(slots=True)
 class RaftState:
     identifier: int
 
+    # Declared as fields so they land in the generated __slots__, but kept out
+    # of __init__ and set up in __post_init__ as before.
+    log: List[raftlog.LogEntry] = dataclasses.field(init=False)
+    role: raftrole.Role = dataclasses.field(init=False)
+    current_term: int = dataclasses.field(init=False)
+    next_index: Optional[Dict[int, int]] = dataclasses.field(init=False)
+    match_index: Optional[Dict[int, Optional[int]]] = dataclasses.field(init=False)
+    commit_index: int = dataclasses.field(init=False)
+    has_followers: Optional[bool] = dataclasses.field(init=False)
+    voted_for: Optional[int] = dataclasses.field(init=False)
+    current_votes: Optional[Dict[int, Optional[int]]] = dataclasses.field(init=False)
+    config: Dict[int, Tuple[str, int]] = dataclasses.field(init=False)
+    experimental_mode: bool = dataclasses.field(init=False)
+    cached_config: Optional[Dict[int, Tuple[str, int]]] = dataclasses.field(init=False)
+    cached_followers: List[int] = dataclasses.field(init=False)
+    cached_majority: int = dataclasses.field(init=False)
+    null_match_index_count: int = dataclasses.field(init=False)
+    self_vote_count: int = dataclasses.field(init=False)
+    heartbeat_cache: Dict[
+        int, Tuple[Tuple[int, int, int, int], raftmessage.AppendEntryRequest]
+    ] = dataclasses.field(init=False)
+
     def __post_init__(self) -> None:
-        self.log: List[raftlog.LogEntry] = []
-        self.role: raftrole.Role = raftrole.Role.FOLLOWER
-        self.current_term: int = -1
-        self.next_index: Optional[Dict[int, int]] = None
-        self.match_index: Optional[Dict[int, Optional[int]]] = None
-        self.commit_index: int = -1
-        self.has_followers: Optional[bool] = None
-        self.voted_for: Optional[int] = None
-        self.current_votes: Optional[Dict[int, Optional[int]]] = None
-        self.config: Dict[int, Tuple[str, int]] = raftconfig.ADDRESS_BY_IDENTIFIER
-        self.experimental_mode: bool = False
+        self.log = []
+        self.role = raftrole.Role.FOLLOWER
+        self.current_term = -1
+        self.next_index = None
+        self.match_index = None
+        self.commit_index = -1
+        self.has_followers = None
+        self.voted_for = None
+        self.current_votes = None
+        self.config = raftconfig.ADDRESS_BY_IDENTIFIER
+        self.experimental_mode = False
+        self.cached_config = None
+        self.cached_followers = []
+        self.cached_majority = 0
+        self.null_match_index_count = 0
+        self.self_vote_count = 0
+        self.heartbeat_cache = {}
 
     ###   MULTI-PURPOSE HELPERS
 
+    def refresh_config_cache(self) -> None:
+        # The followers list and majority count only change when config is
+        # replaced, which tests do after construction, so key the cache on
+        # config identity rather than computing once up front.
+        if self.cached_config is not self.config:
+            self.cached_config = self.config
+            self.cached_followers = [
+                identifier
+                for identifier in self.config
+                if identifier != self.identifier
+            ]
+            self.cached_majority = 1 + len(self.config) // 2
+
     def count_majority(self) -> int:
-        return 1 + len(self.config) // 2
+        self.refresh_config_cache()
+        return self.cached_majority
 
     def create_followers_list(self) -> List[int]:
-        followers = list(self.config.keys())
-        followers.remove(self.identifier)
-
-        return followers
+        self.refresh_config_cache()
+        return self.cached_followers
 
     def implement_state_change(self, state_change: raftrole.StateChange) -> None:
         if state_change["role_change"] is not None:
@@ -102,50 +238,11 @@ class RaftState:
 
         self.current_term = state_change["current_term"]
 
-        match state_change["next_index"]:
-            case raftrole.Operation.RESET_TO_NONE:
-                self.next_index = None
-            case raftrole.Operation.INITIALIZE:
-                self.next_index = {
-                    identifier: len(self.log) for identifier in self.config
-                }
-
-        match state_change["match_index"]:
-            case raftrole.Operation.RESET_TO_NONE:
-                self.match_index = None
-            case raftrole.Operation.INITIALIZE:
-                self.match_index = {identifier: None for identifier in self.config}
-                self.match_index[self.identifier] = len(self.log) - 1
-
-        # Exception to RESET_TO_NONE, where reset is to -1. This is to simplify
-        # message passing since integers are handled in the encoding/decoding
-        # step, but None needs an extra step. Setting to -1 skip this step, but
-        # care is needed at call sites to make sure change is via assignment
-        # rather than addition.
-        match state_change["commit_index"]:
-            case raftrole.Operation.RESET_TO_NONE:
-                self.commit_index = -1
-            case raftrole.Operation.INITIALIZE:
-                raise Exception("Invalid initialization operation for commit index.")
-
-        match state_change["has_followers"]:
-            case raftrole.Operation.RESET_TO_NONE:
-                self.has_followers = None
-            case raftrole.Operation.INITIALIZE:
-                self.has_followers = False
-
-        match state_change["voted_for"]:
-            case raftrole.Operation.RESET_TO_NONE:
-                self.voted_for = None
-            case raftrole.Operation.INITIALIZE:
-                self.voted_for = self.identifier
-
-        match state_change["current_votes"]:
-            case raftrole.Operation.RESET_TO_NONE:
-                self.current_votes = None
-            case raftrole.Operation.INITIALIZE:
-                self.current_votes = {identifier: None for identifier in self.config}
-                self.current_votes[self.identifier] = self.identifier
+        for attribute, operations in OPERATIONS_BY_ATTRIBUTE.items():
+            operation = operations.get(state_change[attribute])
+
+            if operation is not None:
+                operation(self)
 
     ###   CLIENT-RELATED HANDLER
 
@@ -159,10 +256,14 @@ class RaftState:
             raise Exception("Not able to append entries when not leader.")
 
         self.log.append(raftlog.LogEntry(self.current_term, item))
+        log_length = len(self.log)
+
+        self.next_index[target] = log_length
+
+        if self.match_index[target] is None:
+            self.null_match_index_count -= 1
 
-        assert self.next_index is not None and self.match_index is not None
-        self.next_index[target] = len(self.log)
-        self.match_index[target] = len(self.log) - 1
+        self.match_index[target] = log_length - 1
 
         return []
 
@@ -171,47 +272,42 @@ class RaftState:
     def create_append_entries_arguments(
         self, target: int
     ) -> Tuple[int, int, int, List[raftlog.LogEntry], int]:
-        assert self.next_index is not None
         next_index = self.next_index[target]
-
-        assert next_index is not None
         previous_index = next_index - 1
+        log_length = len(self.log)
         previous_term = (
             self.log[previous_index].term
-            if len(self.log) > 0 and previous_index >= 0
+            if log_length > 0 and previous_index >= 0
             else -1
         )
 
+        entries = self.log[next_index:] if next_index < log_length else EMPTY_ENTRIES
+
         return (
             self.current_term,
             previous_index,
             previous_term,
-            self.log[next_index:],
+            entries,
             self.commit_index,
         )
 
     def count_null_match_index(self) -> int:
-        assert self.match_index is not None
-        return len(
-            [
-                identifier
-                for identifier in self.match_index.values()
-                if identifier is None
-            ]
-        )
+        return self.null_match_index_count
 
     def get_index_metrics(self) -> Tuple[int, int]:
-        assert self.match_index is not None
-        non_null_match_index_values = sorted(
-            [value for value in self.match_index.values() if value is not None]
-        )
+        non_null_match_index_values = [
+            value for value in self.match_index.values() if value is not None
+        ]
         non_null_match_index_count = len(non_null_match_index_values)
 
         # Get median value with index corrected for null values
         median_match_index = self.count_majority() - 1 - self.count_null_match_index()
 
-        if 0 <= median_match_index < len(non_null_match_index_values):
-            potential_commit_index = non_null_match_index_values[median_match_index]
+        if 0 <= median_match_index < non_null_match_index_count:
+            # Selection of the median value rather than a full sort.
+            potential_commit_index = heapq.nsmallest(
+                median_match_index + 1, non_null_match_index_values
+            )[-1]
 
         else:
             potential_commit_index = -1
@@ -219,25 +315,27 @@ class RaftState:
         return non_null_match_index_count, potential_commit_index
 
     def update_indexes(self, target: int, entries_length: int) -> None:
-        assert self.next_index is not None and self.match_index is not None
         self.next_index[target] += entries_length
+
+        if self.match_index[target] is None:
+            self.null_match_index_count -= 1
+
         self.match_index[target] = self.next_index[target] - 1
 
         # Change to leader's commit_index is only relevant after a successful
         # append entry response from follower.
         non_null_match_index_count, potential_commit_index = self.get_index_metrics()
 
-        # Require at least majority of next_index to be non-null.
-        if non_null_match_index_count < self.count_majority():
-            return None
-
-        # Require latest be entry from leader's current term.
-        update_commit_index = (
-            len(self.log) > 0
-            and self.log[potential_commit_index].term == self.current_term
-        )
-
-        if update_commit_index or self.experimental_mode:
+        # Require at least majority of next_index to be non-null and latest be
+        # entry from leader's current term, with the term requirement waived
+        # in experimental mode.
+        if non_null_match_index_count >= self.count_majority() and (
+            self.experimental_mode
+            or (
+                len(self.log) > 0
+                and self.log[potential_commit_index].term == self.current_term
+            )
+        ):
             self.commit_index = potential_commit_index
 
     def handle_leader_heartbeat(
@@ -258,12 +356,40 @@ class RaftState:
 
         messages: List[raftmessage.Message] = []
 
+        # Followers caught up to the same next_index share identical arguments,
+        # so compute once per distinct next_index for this heartbeat pass.
+        arguments_by_next_index: Dict[
+            int, Tuple[int, int, int, List[raftlog.LogEntry], int]
+        ] = {}
+
+        log_length = len(self.log)
+
         for follower in followers:
+            next_index = self.next_index[follower]
+
+            # An idle leader sends the same request to the same follower tick
+            # after tick, so reuse the previous message when nothing it
+            # depends on has moved. The leader's log is append-only within a
+            # term, making the key below sufficient to pin the entries.
+            key = (next_index, self.current_term, self.commit_index, log_length)
+            cached = self.heartbeat_cache.get(follower)
+
+            if cached is not None and cached[0] == key:
+                messages.append(cached[1])
+                continue
+
+            arguments = arguments_by_next_index.get(next_index)
+
+            if arguments is None:
+                arguments = self.create_append_entries_arguments(follower)
+                arguments_by_next_index[next_index] = arguments
+
             message = raftmessage.AppendEntryRequest(
                 self.identifier,
                 follower,
-                *self.create_append_entries_arguments(follower),
+                *arguments,
             )
+            self.heartbeat_cache[follower] = (key, message)
             messages.append(message)
 
         return messages
@@ -295,6 +421,7 @@ class RaftState:
                     self.current_term,
                     False,
                     len(entries),
+                    previous_index,
                 )
             ]
 
@@ -302,6 +429,15 @@ class RaftState:
             self.log, previous_index, previous_term, entries
         )
 
+        # On failure, hint at the first index the leader should retry from so
+        # the leader can jump next_index there directly rather than probe one
+        # entry at a time.
+        hint = (
+            len(self.log)
+            if success
+            else raftlog.conflict_hint(self.log, previous_index, previous_term)
+        )
+
         # Movement of commit_index by follower is based on commit_index on
         # leader and length of own log.
         if commit_index > self.commit_index:
@@ -309,7 +445,7 @@ class RaftState:
 
         return [
             raftmessage.AppendEntryResponse(
-                target, source, self.current_term, success, len(entries)
+                target, source, self.current_term, success, len(entries), hint
             )
         ]
 
@@ -320,6 +456,7 @@ class RaftState:
         current_term: int,
         success: bool,
         entries_length: int,
+        hint: int,
     ) -> List[raftmessage.Message]:
         """
         Follower response (received by leader).
@@ -338,15 +475,14 @@ class RaftState:
         # If successful, update indexes.
         if success:
             self.update_indexes(source, entries_length)
-
-            assert self.has_followers is not None
             self.has_followers = True
 
             return []
 
-        # If not successful, retry with earlier entries.
-        assert self.next_index is not None and self.next_index[source] is not None
-        self.next_index[source] = self.next_index[source] - 1
+        # If not successful, retry from the follower's conflict hint. The hint
+        # is capped by a single-step decrement so a stale or adversarial
+        # response can never move next_index forward.
+        self.next_index[source] = max(0, min(self.next_index[source] - 1, hint))
 
         return [
             raftmessage.AppendEntryRequest(
@@ -359,14 +495,7 @@ class RaftState:
     ###   CANDIDATE-RELATED HELPERS AND HANDLERS
 
     def count_self_votes(self) -> int:
-        assert self.current_votes is not None
-        return len(
-            [
-                identifier
-                for identifier in self.current_votes.values()
-                if identifier == self.identifier
-            ]
-        )
+        return self.self_vote_count
 
     def has_won_election(self) -> bool:
         return self.count_self_votes() >= self.count_majority()
@@ -389,14 +518,15 @@ class RaftState:
 
         messages: List[raftmessage.Message] = []
 
-        previous_term = self.log[-1].term if len(self.log) > 0 else -1
+        last_log_index = len(self.log) - 1
+        previous_term = self.log[-1].term if last_log_index >= 0 else -1
 
         for follower in followers:
             message = raftmessage.RequestVoteRequest(
                 self.identifier,
                 follower,
                 self.current_term,
-                len(self.log) - 1,
+                last_log_index,
                 previous_term,
             )
             messages.append(message)
@@ -424,30 +554,21 @@ class RaftState:
                 )
             ]
 
-        # Require candidate have higher term.
-        if current_term < self.current_term:
-            success = False
-
-        # Require candidate have at least same log length.
-        elif last_log_index < len(self.log) - 1:
-            success = False
-
-        # Require candidate have last entry having at least the same term.
-        elif len(self.log) > 0 and last_log_term < self.log[-1].term:
-            success = False
-
-        else:
-            assert current_term == self.current_term
-
-            # Require vote not already cast to a different candidate.
-            if self.voted_for is not None and self.voted_for != source:
-                success = False
-
-            else:
-                if self.voted_for is None:
-                    self.voted_for = source
+        # Require candidate have at least the same term (the state change
+        # above lifts the local term, so a lower candidate term is the only
+        # remaining failure mode), at least same log length, last entry having
+        # at least the same term, and vote not already cast to a different
+        # candidate.
+        log_length = len(self.log)
+        success = (
+            current_term >= self.current_term
+            and last_log_index >= log_length - 1
+            and (log_length == 0 or last_log_term >= self.log[-1].term)
+            and (self.voted_for is None or self.voted_for == source)
+        )
 
-                success = True
+        if success and self.voted_for is None:
+            self.voted_for = source
 
         return [
             raftmessage.RequestVoteResponse(target, source, success, self.current_term)
@@ -473,8 +594,11 @@ class RaftState:
             return []
 
         if success:
-            assert self.current_votes is not None
-            self.current_votes[source] = target
+            if self.current_votes[source] is None:
+                self.current_votes[source] = target
+
+                if target == self.identifier:
+                    self.self_vote_count += 1
 
             if self.has_won_election():
                 state_change = raftrole.enumerate_state_change(
@@ -559,8 +683,9 @@ class RaftState:
         Simplify testing by enabling state to be exposed.
         """
         if text.startswith("self"):
+            fields = sorted(dataclasses.fields(self), key=lambda field: field.name)
             text = "\n".join(
-                [f"{item[0]}: {str(item[1])}" for item in sorted(vars(self).items())]
+                [f"{field.name}: {str(getattr(self, field.name))}" for field in fields]
             )
             print("\n\n" + "\033[37m" + text)
 
@@ -569,38 +694,115 @@ class RaftState:
     ###   PUBLIC INTERFACE
 
     def handle_message(self, message: raftmessage.Message) -> List[raftmessage.Message]:
-        match message:
-            case raftmessage.ClientLogAppend():
-                return self.handle_client_log_append(**vars(message))
-
-            case raftmessage.UpdateFollowers():
-                return self.handle_leader_heartbeat(**vars(message))
+        handler = HANDLER_BY_TYPE.get(type(message))
 
-            case raftmessage.AppendEntryRequest():
-                return self.handle_append_entries_request(**vars(message))
-
-            case raftmessage.AppendEntryResponse():
-                return self.handle_append_entries_response(**vars(message))
-
-            case raftmessage.RunElection():
-                return self.handle_candidate_solicitation(**vars(message))
-
-            case raftmessage.RequestVoteRequest():
-                return self.handle_request_vote_request(**vars(message))
-
-            case raftmessage.RequestVoteResponse():
-                return self.handle_request_vote_response(**vars(message))
-
-            case raftmessage.RoleChange():
-                return self.handle_role_change(**vars(message))
-
-            case raftmessage.Text():
-                return self.handle_text(**vars(message))
+        if handler is None:
+            raise Exception(
+                "Exhaustive switch error on message type with message {message}."
+            )
 
-            case _:
-                raise Exception(
-                    "Exhaustive switch error on message type with message {message}."
-                )
+        return handler(self, message)
+
+
+def dispatch_client_log_append(
+    state: RaftState, message: raftmessage.ClientLogAppend
+) -> List[raftmessage.Message]:
+    return state.handle_client_log_append(
+        message.source, message.target, message.item
+    )
+
+
+def dispatch_leader_heartbeat(
+    state: RaftState, message: raftmessage.UpdateFollowers
+) -> List[raftmessage.Message]:
+    return state.handle_leader_heartbeat(
+        message.source, message.target, message.followers
+    )
+
+
+def dispatch_append_entries_request(
+    state: RaftState, message: raftmessage.AppendEntryRequest
+) -> List[raftmessage.Message]:
+    return state.handle_append_entries_request(
+        message.source,
+        message.target,
+        message.current_term,
+        message.previous_index,
+        message.previous_term,
+        message.entries,
+        message.commit_index,
+    )
+
+
+def dispatch_append_entries_response(
+    state: RaftState, message: raftmessage.AppendEntryResponse
+) -> List[raftmessage.Message]:
+    return state.handle_append_entries_response(
+        message.source,
+        message.target,
+        message.current_term,
+        message.success,
+        message.entries_length,
+        message.hint,
+    )
+
+
+def dispatch_candidate_solicitation(
+    state: RaftState, message: raftmessage.RunElection
+) -> List[raftmessage.Message]:
+    return state.handle_candidate_solicitation(
+        message.source, message.target, message.followers
+    )
+
+
+def dispatch_request_vote_request(
+    state: RaftState, message: raftmessage.RequestVoteRequest
+) -> List[raftmessage.Message]:
+    return state.handle_request_vote_request(
+        message.source,
+        message.target,
+        message.current_term,
+        message.last_log_index,
+        message.last_log_term,
+    )
+
+
+def dispatch_request_vote_response(
+    state: RaftState, message: raftmessage.RequestVoteResponse
+) -> List[raftmessage.Message]:
+    return state.handle_request_vote_response(
+        message.source,
+        message.target,
+        message.success,
+        message.current_term,
+    )
+
+
+def dispatch_role_change(
+    state: RaftState, message: raftmessage.RoleChange
+) -> List[raftmessage.Message]:
+    return state.handle_role_change(
+        message.source, message.target, message.from_role, message.to_role
+    )
+
+
+def dispatch_text(
+    state: RaftState, message: raftmessage.Text
+) -> List[raftmessage.Message]:
+    return state.handle_text(message.source, message.target, message.text)
+
+
+HANDLER_BY_TYPE = {
+    raftmessage.ClientLogAppend: dispatch_client_log_append,
+    raftmessage.UpdateFollowers: dispatch_leader_heartbeat,
+    raftmessage.AppendEntryRequest: dispatch_append_entries_request,
+    raftmessage.AppendEntryResponse: dispatch_append_entries_response,
+    raftmessage.RunElection: dispatch_candidate_solicitation,
+    raftmessage.RequestVoteRequest: dispatch_request_vote_request,
+    raftmessage.RequestVoteResponse: dispatch_request_vote_response,
+    raftmessage.RoleChange: dispatch_role_change,
+    raftmessage.Text: dispatch_text,
+}
 
 
 def change_state_on_timeout(state: RaftState) -> raftmessage.Message:
@@ -17,20 +17,24 @@ def init_raft_state(
     state.identifier = identifier
     state.log = log
     state.current_term = current_term
-    state.role = raftrole.Role.FOLLOWER
+    state.role = role
 
+    # Stamp the post-election attributes directly via the same operations the
+    # role transitions would run, rather than driving each state through the
+    # follower-candidate-leader churn message by message.
     if role in {raftrole.Role.CANDIDATE, raftrole.Role.LEADER}:
-        state.change_role(
-            raftrole.Role.FOLLOWER,
-            raftrole.Role.CANDIDATE,
-            state.current_term - 1,
-        )
-        messages = state.handle_candidate_solicitation()
+        raftstate.initialize_voted_for(state)
+        raftstate.initialize_current_votes(state)
 
         if role == raftrole.Role.LEADER:
-            state.change_role(raftrole.Role.CANDIDATE, raftrole.Role.LEADER)
+            raftstate.initialize_next_index(state)
+            raftstate.initialize_match_index(state)
+            raftstate.initialize_has_followers(state)
             messages = state.handle_leader_heartbeat()
 
+        else:
+            messages = state.handle_candidate_solicitation()
+
     else:
         messages = []
 
@@ -164,19 +168,20 @@ def test_handle_append_entries_request(
     assert isinstance(response[0], raftmessage.AppendEntryResponse)
     assert not response[0].success
     assert response[0].entries_length == 1
+    assert response[0].hint == 10
 
 
 def test_handle_append_entries_response(paper_log: List[raftlog.LogEntry]) -> None:
     # Figure 7
     leader_state, _ = init_raft_state(1, paper_log, raftrole.Role.LEADER, 6)
 
-    response = leader_state.handle_append_entries_response(2, 1, 6, False, 0)
+    response = leader_state.handle_append_entries_response(2, 1, 6, False, 0, 9)
     assert isinstance(response[0], raftmessage.AppendEntryRequest)
     assert response[0].previous_index == 8
     assert response[0].previous_term == 6
     assert response[0].entries == [raftlog.LogEntry(6, "6")]
 
-    response = leader_state.handle_append_entries_response(2, 1, 6, True, 1)
+    response = leader_state.handle_append_entries_response(2, 1, 6, True, 1, 10)
     assert len(response) == 0
 
 
@@ -223,15 +228,15 @@ def test_handle_message_b(
         paper_log, logs_by_identifier["b"], None
     )
 
-    for i in range(6):
-        response = follower_state.handle_message(request[0])
-
-        assert not response[0].success
-        assert response[0].entries_length == i
-        assert leader_state.next_index[2] == 10 - i
-
-        request = leader_state.handle_message(response[0])
+    # Follower's log ends at index 3, so the hint jumps next_index straight to
+    # the end of the follower's log.
+    response = follower_state.handle_message(request[0])
+    assert not response[0].success
+    assert response[0].entries_length == 0
+    assert response[0].hint == 4
+    assert leader_state.next_index[2] == 10
 
+    request = leader_state.handle_message(response[0])
     response = follower_state.handle_message(request[0])
     assert response[0].success
     assert response[0].entries_length == 6
@@ -288,19 +293,28 @@ def test_handle_message_e(
 
     request = leader_state.handle_message(raftmessage.UpdateFollowers(1, 1, [2]))
 
-    for i in range(5):
-        response = follower_state.handle_message(request[0])
-
-        assert not response[0].success
-        assert response[0].entries_length == i
-        assert leader_state.next_index[2] == 10 - i
+    # Follower's log ends at index 6, so the first hint jumps next_index to
+    # the end of the follower's log.
+    response = follower_state.handle_message(request[0])
+    assert not response[0].success
+    assert response[0].entries_length == 0
+    assert response[0].hint == 7
+    assert leader_state.next_index[2] == 10
 
-        request = leader_state.handle_message(response[0])
+    # Follower's entries at indexes 3-6 all carry conflicting term 4, so the
+    # second hint jumps next_index to the first entry of that term.
+    request = leader_state.handle_message(response[0])
+    response = follower_state.handle_message(request[0])
+    assert not response[0].success
+    assert response[0].entries_length == 3
+    assert response[0].hint == 3
+    assert leader_state.next_index[2] == 7
 
+    request = leader_state.handle_message(response[0])
     response = follower_state.handle_message(request[0])
     assert response[0].success
-    assert response[0].entries_length == 5
-    assert leader_state.next_index[2] == 5
+    assert response[0].entries_length == 7
+    assert leader_state.next_index[2] == 3
 
     assert len(leader_state.handle_message(response[0])) == 0
     assert leader_state.next_index[2] == 10
@@ -315,15 +329,24 @@ def test_handle_message_f(
         paper_log, logs_by_identifier["f"], None
     )
 
-    for i in range(7):
-        response = follower_state.handle_message(request[0])
-
-        assert not response[0].success
-        assert response[0].entries_length == i
-        assert leader_state.next_index[2] is 10 - i
+    # Follower's entries at indexes 6-10 all carry conflicting term 3, so the
+    # first hint jumps next_index to the first entry of that term.
+    response = follower_state.handle_message(request[0])
+    assert not response[0].success
+    assert response[0].entries_length == 0
+    assert response[0].hint == 6
+    assert leader_state.next_index[2] == 10
 
-        request = leader_state.handle_message(response[0])
+    # Follower's entries at indexes 3-5 all carry conflicting term 2, so the
+    # second hint jumps next_index to the first entry of that term.
+    request = leader_state.handle_message(response[0])
+    response = follower_state.handle_message(request[0])
+    assert not response[0].success
+    assert response[0].entries_length == 4
+    assert response[0].hint == 3
+    assert leader_state.next_index[2] == 6
 
+    request = leader_state.handle_message(response[0])
     response = follower_state.handle_message(request[0])
     assert response[0].success
     assert response[0].entries_length == 7
@@ -358,16 +381,12 @@ def test_consensus(
     assert leader_state.commit_index == 9
 
     response_b = follower_b_state.handle_message(request[1])
+    request_b = leader_state.handle_message(response_b[0])
+    assert leader_state.next_index == {1: 10, 2: 10, 3: 4}
+    assert leader_state.match_index == {1: 9, 2: 9, 3: None}
+    assert leader_state.commit_index == 9
 
-    for i in range(6):
-        request_b = leader_state.handle_message(response_b[0])
-
-        assert leader_state.next_index == {1: 10, 2: 10, 3: 9 - i}
-        assert leader_state.match_index == {1: 9, 2: 9, 3: None}
-        assert leader_state.commit_index == 9
-
-        response_b = follower_b_state.handle_message(request_b[0])
-
+    response_b = follower_b_state.handle_message(request_b[0])
     leader_state.handle_message(response_b[0])
     assert leader_state.next_index == {1: 10, 2: 10, 3: 10}
     assert leader_state.match_index == {1: 9, 2: 9, 3: 9}